@@ -3,3 +3,7 @@
 DEFAULT_ISIS_EXECUTABLE_PATH = "isis.sh"
 """The path to the ISiS shell script. When installing ISiS with the packed
 'Install_ISiS_commandline.sh' script, the path should be 'isis.sh'."""
+
+SCORE_FILE_BUFFER_SIZE = 1 << 17
+"""Buffer size in bytes which is used when writing ISiS score files.
+A large buffer reduces the number of write calls for long scores."""
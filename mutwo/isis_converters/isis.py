@@ -6,8 +6,10 @@ them from melody and lyrics."
 <https://isis-documentation.readthedocs.io/en/latest/Intro.html#the-isis-command-line>`_.
 """
 
-import configparser
+import itertools
 import os
+import shlex
+import subprocess
 import typing
 
 from mutwo import core_converters
@@ -24,7 +26,8 @@ ConvertableEventUnion = typing.Union[
     core_events.SequentialEvent[core_events.SimpleEvent],
 ]
 ExtractedDataDict = dict[
-    # duration, consonants, vowel, pitch, volume
+    # duration, consonants, vowel, pitch, volume and their formatted
+    # score strings for midi pitch number, duration and amplitude
     str,
     typing.Any,
 ]
@@ -38,24 +41,36 @@ class EventToIsisScore(core_converters.abc.EventConverter):
     :param simple_event_to_volume:
     :param simple_event_to_vowel:
     :param simple_event_to_consonant_tuple:
-    :param is_simple_event_rest:
+    :param is_simple_event_rest: Function to detect if a simple event is a rest.
+        Adjacent rests are tied together and each rest is written to the score
+        as a silent event, so that pitch, volume and lyrics of events for which
+        this function returns ``True`` are ignored. By default any event
+        without a ``pitch_list`` attribute or with an empty ``pitch_list`` is
+        regarded as a rest.
     :param tempo: Tempo in beats per minute (BPM). Defaults to 60.
     :param global_transposition: global transposition in midi numbers. Defaults to 0.
     :param n_events_per_line: How many events the score shall contain per line.
         Defaults to 5.
     """
 
+    _rest_pitch = music_parameters.WesternPitch(
+        "c",
+        -1,
+        concert_pitch=440,
+        concert_pitch_octave=4,
+        concert_pitch_pitch_class=9,
+    )
+    _rest_volume = music_parameters.DirectVolume(0)
+
+    # Rests always share the same pitch and volume, therefore their score
+    # strings only need to be calculated once.
     _extracted_data_dict_rest = {
         "consonant_tuple": tuple([]),
         "vowel": "_",
-        "pitch": music_parameters.WesternPitch(
-            "c",
-            -1,
-            concert_pitch=440,
-            concert_pitch_octave=4,
-            concert_pitch_pitch_class=9,
-        ),
-        "volume": music_parameters.DirectVolume(0),
+        "pitch": _rest_pitch,
+        "volume": _rest_volume,
+        "midi_pitch_number_string": str(_rest_pitch.midi_pitch_number),
+        "amplitude_string": str(_rest_volume.amplitude),
     }
 
     def __init__(
@@ -76,10 +91,7 @@ class EventToIsisScore(core_converters.abc.EventConverter):
         ] = lambda simple_event: simple_event.consonant_tuple,  # type: ignore
         is_simple_event_rest: typing.Callable[
             [core_events.SimpleEvent], bool
-        ] = lambda simple_event: not (
-            hasattr(simple_event, "pitch_list")
-            and simple_event.pitch_list  # type: ignore
-        ),
+        ] = lambda simple_event: not getattr(simple_event, "pitch_list", None),
         tempo: core_constants.Real = 60,
         global_transposition: int = 0,
         default_sentence_loudness: typing.Union[core_constants.Real, None] = None,
@@ -97,58 +109,80 @@ class EventToIsisScore(core_converters.abc.EventConverter):
             "pitch": simple_event_to_pitch,
             "volume": simple_event_to_volume,
         }
+        self._extraction_function_tuple = tuple(
+            self._extraction_function_dict.items()
+        )
 
     # ###################################################################### #
     #                           private methods                              #
     # ###################################################################### #
 
-    def _add_lyric_section(
+    @staticmethod
+    def _write_option(
+        score_file: typing.TextIO,
+        option_name: str,
+        value_iterable: typing.Iterable[str],
+        separator: str = ", ",
+    ):
+        # ":" delimiter is used in ISiS example score files
+        # see https://isis-documentation.readthedocs.io/en/latest/score.html#score-example
+        score_file.write(f"{option_name} : ")
+        # Values are written one by one, so that we never have to keep
+        # the complete (potentially long) joined string in memory.
+        for index, value in enumerate(value_iterable):
+            if index:
+                score_file.write(separator)
+            score_file.write(value)
+        score_file.write("\n")
+
+    def _write_lyric_section(
         self,
-        score_config_file: configparser.ConfigParser,
+        score_file: typing.TextIO,
         extracted_data_dict_per_event_tuple: tuple[ExtractedDataDict, ...],
     ):
-        score_config_file[isis_converters.constants.SECTION_LYRIC_NAME] = {
-            "xsampa": " ".join(
-                map(
-                    lambda extracted_data: " ".join(
-                        extracted_data["consonant_tuple"] + (extracted_data["vowel"],)
-                    ),
-                    extracted_data_dict_per_event_tuple,
+        score_file.write(f"[{isis_converters.constants.SECTION_LYRIC_NAME}]\n")
+        self._write_option(
+            score_file,
+            "xsampa",
+            (
+                phoneme
+                for extracted_data in extracted_data_dict_per_event_tuple
+                for phoneme in (
+                    *extracted_data["consonant_tuple"],
+                    extracted_data["vowel"],
                 )
-            )
-        }
+            ),
+            separator=" ",
+        )
+        score_file.write("\n")
 
-    def _add_score_section(
+    def _write_score_section(
         self,
-        score_config_file: configparser.ConfigParser,
+        score_file: typing.TextIO,
         extracted_data_dict_per_event_tuple: tuple[ExtractedDataDict, ...],
     ):
-        score_section = {
-            "globalTransposition": self._global_transposition,
-            "tempo": self._tempo,
-        }
-        for parameter_name, lambda_function in (
-            (
-                "midiNotes",
-                lambda extracted_data: str(extracted_data["pitch"].midi_pitch_number),
-            ),
-            (
-                "rhythm",
-                lambda extracted_data: str(extracted_data["duration"]),
-            ),
-            (
-                "loud_accents",
-                lambda extracted_data: str(extracted_data["volume"].amplitude),
-            ),
+        score_file.write(f"[{isis_converters.constants.SECTION_SCORE_NAME}]\n")
+        for option_name, value in (
+            ("globalTransposition", self._global_transposition),
+            ("tempo", self._tempo),
         ):
-            score_section.update(
-                {
-                    parameter_name: ", ".join(
-                        map(lambda_function, extracted_data_dict_per_event_tuple)
-                    )
-                }
-            )
-        score_config_file[isis_converters.constants.SECTION_SCORE_NAME] = score_section
+            self._write_option(score_file, option_name, (str(value),))
+
+        # Collect all parameters in one pass, so that we only have to
+        # iterate once over (potentially long) sequences.
+        midi_note_list, rhythm_list, loud_accent_list = [], [], []
+        for extracted_data in extracted_data_dict_per_event_tuple:
+            midi_note_list.append(extracted_data["midi_pitch_number_string"])
+            rhythm_list.append(extracted_data["duration_string"])
+            loud_accent_list.append(extracted_data["amplitude_string"])
+
+        for option_name, value_list in (
+            ("midiNotes", midi_note_list),
+            ("rhythm", rhythm_list),
+            ("loud_accents", loud_accent_list),
+        ):
+            self._write_option(score_file, option_name, value_list)
+        score_file.write("\n")
 
     def _convert_simple_event(
         self,
@@ -156,20 +190,82 @@ class EventToIsisScore(core_converters.abc.EventConverter):
         _: core_constants.DurationType,
     ) -> tuple[ExtractedDataDict]:
         duration = simple_event_to_convert.duration.duration_in_floats
+        # Check for rests before calling any extraction function, so
+        # that we don't need to rely on raised exceptions for them.
+        if self._is_simple_event_rest(simple_event_to_convert):
+            return (self._get_extracted_data_dict_rest(duration),)
+
         extracted_data_dict: dict[str, typing.Any] = {"duration": duration}
         for (
             extracted_data_name,
             extraction_function,
-        ) in self._extraction_function_dict.items():
+        ) in self._extraction_function_tuple:
             try:
                 extracted_information = extraction_function(simple_event_to_convert)
             except AttributeError:
-                return (dict(duration=duration, **self._extracted_data_dict_rest),)
+                return (self._get_extracted_data_dict_rest(duration),)
 
-            extracted_data_dict.update({extracted_data_name: extracted_information})
+            extracted_data_dict[extracted_data_name] = extracted_information
 
+        self._add_score_string_data(extracted_data_dict)
         return (extracted_data_dict,)
 
+    def _get_extracted_data_dict_rest(
+        self, duration: core_constants.Real
+    ) -> ExtractedDataDict:
+        extracted_data_dict = self._extracted_data_dict_rest.copy()
+        extracted_data_dict["duration"] = duration
+        extracted_data_dict["duration_string"] = str(duration)
+        return extracted_data_dict
+
+    def _add_score_string_data(self, extracted_data_dict: ExtractedDataDict):
+        # Evaluate (potentially expensive) properties and format them as
+        # strings only once per event.
+        extracted_data_dict["midi_pitch_number_string"] = str(
+            extracted_data_dict["pitch"].midi_pitch_number
+        )
+        extracted_data_dict["duration_string"] = str(extracted_data_dict["duration"])
+        extracted_data_dict["amplitude_string"] = str(
+            extracted_data_dict["volume"].amplitude
+        )
+
+    def _has_adjacent_rests(self, complex_event: core_events.abc.ComplexEvent) -> bool:
+        # For anything else than a flat sequence of simple events we can't
+        # cheaply tell if rests are adjacent, so we act as if they would be.
+        if not isinstance(complex_event, core_events.SequentialEvent) or any(
+            not isinstance(event, core_events.SimpleEvent) for event in complex_event
+        ):
+            return True
+        is_simple_event_rest = self._is_simple_event_rest
+        return any(
+            is_simple_event_rest(event0) and is_simple_event_rest(event1)
+            for event0, event1 in zip(
+                complex_event, itertools.islice(complex_event, 1, None)
+            )
+        )
+
+    def _convert_sequential_event(
+        self,
+        sequential_event: core_events.SequentialEvent,
+        _: core_constants.DurationType,
+        depth: int = 0,
+    ) -> tuple[ExtractedDataDict, ...]:
+        # In contrast to the default implementation we neither need the
+        # absolute times of the events nor the generic event dispatch for
+        # simple events, because ISiS scores only contain durations.
+        # Therefore the entry delays of the children are deliberately not
+        # calculated and 0 is passed instead.
+        convert_simple_event = self._convert_simple_event
+        extracted_data_dict_list: list[ExtractedDataDict] = []
+        for event in sequential_event:
+            if isinstance(event, core_events.SimpleEvent):
+                extracted_data_dict_list.extend(convert_simple_event(event, 0))
+            else:
+                extracted_data_dict_list.extend(
+                    self._convert_event(event, 0, depth + 1)
+                )
+        return tuple(extracted_data_dict_list)
+
     def _convert_simultaneous_event(
         self,
         _: core_events.SimultaneousEvent,
@@ -211,7 +307,11 @@ class EventToIsisScore(core_converters.abc.EventConverter):
 
         # ISiS can't handle two sequental rests, therefore we have to tie two
         # adjacent rests together.
-        if isinstance(event_to_convert, core_events.abc.ComplexEvent):
+        # Because 'tie_by' with 'mutate=False' copies the complete event, we
+        # only call it if there are any adjacent rests.
+        if isinstance(
+            event_to_convert, core_events.abc.ComplexEvent
+        ) and self._has_adjacent_rests(event_to_convert):
             event_to_convert = event_to_convert.tie_by(
                 lambda event0, event1: self._is_simple_event_rest(event0)
                 and self._is_simple_event_rest(event1),
@@ -219,17 +319,25 @@ class EventToIsisScore(core_converters.abc.EventConverter):
                 mutate=False,  # type: ignore
             )
 
-        extracted_data_dict_per_event_tuple = self._convert_event(event_to_convert, 0)
-
-        # ":" delimiter is used in ISiS example score files
-        # see https://isis-documentation.readthedocs.io/en/latest/score.html#score-example
-        score_config_file = configparser.ConfigParser(delimiters=":")
-
-        self._add_lyric_section(score_config_file, extracted_data_dict_per_event_tuple)
-        self._add_score_section(score_config_file, extracted_data_dict_per_event_tuple)
+        # Simple events don't need the generic event dispatch.
+        if isinstance(event_to_convert, core_events.SimpleEvent):
+            extracted_data_dict_per_event_tuple = self._convert_simple_event(
+                event_to_convert, 0
+            )
+        else:
+            extracted_data_dict_per_event_tuple = self._convert_event(
+                event_to_convert, 0
+            )
 
-        with open(path, "w") as f:
-            score_config_file.write(f)
+        # The score format is simple and fixed, so we write it directly
+        # instead of using 'configparser'.
+        with open(
+            path,
+            "w",
+            buffering=isis_converters.configurations.SCORE_FILE_BUFFER_SIZE,
+        ) as score_file:
+            self._write_lyric_section(score_file, extracted_data_dict_per_event_tuple)
+            self._write_score_section(score_file, extracted_data_dict_per_event_tuple)
 
 
 class EventToSingingSynthesis(core_converters.abc.Converter):
@@ -279,6 +387,9 @@ class EventToSingingSynthesis(core_converters.abc.Converter):
         :param path: The path / filename of the resulting sound file
         :param score_path: The path where the score file shall be written to.
 
+        :raises FileNotFoundError: If the ISiS executable can't be found.
+        :raises OSError: If the ISiS executable can't be executed.
+
         **Disclaimer:** Before using the :class:`EventToSingingSynthesis`, make sure
         `ISiS <https://forum.ircam.fr/projects/detail/isis/>`_ has been
         correctly installed on your system.
@@ -288,15 +399,21 @@ class EventToSingingSynthesis(core_converters.abc.Converter):
             score_path = f"{path.split('.')[0]}.isis_score.cfg"
 
         self.isis_score_converter.convert(event_to_convert, score_path)
-        command = "{} -m {} -o {}".format(
+        command = [
             self._isis_executable_path,
+            "-m",
             score_path,
+            "-o",
             path,
-        )
-        for flag in self.flags:
-            command += " {} ".format(flag)
-
-        os.system(command)
-
-        if self.remove_score_file:
-            os.remove(score_path)
+            # A flag may also contain its value (e.g. '-v 1'), therefore we
+            # split each flag like a shell would do.
+            *(argument for flag in self.flags for argument in shlex.split(flag)),
+        ]
+
+        # If ISiS can't be executed, 'subprocess.run' raises an exception:
+        # the score file should nevertheless be removed if requested.
+        try:
+            subprocess.run(command, check=False)
+        finally:
+            if self.remove_score_file:
+                os.remove(score_path)
@@ -3,6 +3,8 @@ import os
 import typing
 import unittest
 
+from unittest import mock
+
 from mutwo import core_events
 from mutwo import core_constants
 from mutwo import isis_converters
@@ -80,6 +82,31 @@ class EventToIsisScoreTest(unittest.TestCase):
         self.assertEqual(result_score_section["loud_accents"], "0.5")
         self.assertEqual(result_score_section["tempo"], str(self.converter._tempo))
 
+    def test_convert_file_content(self):
+        pitch = music_parameters.WesternPitch()
+        sequential_event = core_events.SequentialEvent(
+            [
+                NoteLikeWithText([pitch], 2, 0.5, ("t",), "a"),
+                core_events.SimpleEvent(1),
+            ]
+        )
+        self.converter.convert(sequential_event, self.score_path)
+        with open(self.score_path, "r") as score_file:
+            score = score_file.read()
+        self.assertEqual(
+            score,
+            "[lyrics]\n"
+            "xsampa : t a _\n"
+            "\n"
+            "[score]\n"
+            "globalTransposition : 0\n"
+            "tempo : 60\n"
+            f"midiNotes : {pitch.midi_pitch_number}, 0.0\n"
+            "rhythm : 2.0, 1.0\n"
+            "loud_accents : 0.5, 0\n"
+            "\n",
+        )
+
     def test_convert_sequential_event(self):
         # Test if auto tie works!
         sequential_event = core_events.SequentialEvent(
@@ -118,6 +145,73 @@ class EventToIsisScoreTest(unittest.TestCase):
         self.assertEqual(result_score_section["loud_accents"], "0.5, 0, 0.5")
         self.assertEqual(result_score_section["tempo"], str(self.converter._tempo))
 
+    def test_convert_sequential_event_without_adjacent_rests(self):
+        sequential_event = core_events.SequentialEvent(
+            [
+                core_events.SimpleEvent(1),
+                NoteLikeWithText(
+                    [music_parameters.WesternPitch()], 2, 0.5, ("t",), "a"
+                ),
+                core_events.SimpleEvent(3),
+            ]
+        )
+        self.converter.convert(sequential_event, self.score_path)
+        (
+            result_lyric_section,
+            result_score_section,
+        ) = self.fetch_result_score_section_tuple()
+
+        self.assertEqual(result_lyric_section["xsampa"], "_ t a _")
+        self.assertEqual(result_score_section["rhythm"], "1.0, 2.0, 3.0")
+        self.assertEqual(result_score_section["loud_accents"], "0, 0.5, 0")
+
+    def test_has_adjacent_rests(self):
+        note = NoteLikeWithText([music_parameters.WesternPitch()], 2, 0.5, ("t",), "a")
+        rest = core_events.SimpleEvent(1)
+        for event, expected_result in (
+            # flat sequential event without adjacent rests
+            (core_events.SequentialEvent([rest, note.copy(), rest.copy()]), False),
+            # flat sequential event with adjacent rests
+            (core_events.SequentialEvent([note, rest, rest.copy()]), True),
+            # nested events need to be checked by 'tie_by'
+            (
+                core_events.SequentialEvent(
+                    [core_events.SequentialEvent([note.copy()]), note.copy()]
+                ),
+                True,
+            ),
+        ):
+            with self.subTest(event=event):
+                self.assertEqual(
+                    self.converter._has_adjacent_rests(event), expected_result
+                )
+
+    def test_convert_only_ties_if_needed(self):
+        note = NoteLikeWithText([music_parameters.WesternPitch()], 2, 0.5, ("t",), "a")
+        rest = core_events.SimpleEvent(1)
+        original_tie_by = core_events.SequentialEvent.tie_by
+        for event, is_tied in (
+            (core_events.SequentialEvent([rest, note.copy(), rest.copy()]), False),
+            (core_events.SequentialEvent([note, rest, rest.copy()]), True),
+            (
+                core_events.SequentialEvent(
+                    [core_events.SequentialEvent([note.copy()]), note.copy()]
+                ),
+                True,
+            ),
+        ):
+            tied_event_list = []
+
+            def tie_by(self, *args, **kwargs):
+                tied_event_list.append(self)
+                return original_tie_by(self, *args, **kwargs)
+
+            with self.subTest(event=event), mock.patch.object(
+                core_events.SequentialEvent, "tie_by", tie_by
+            ):
+                self.converter.convert(event, self.score_path)
+                self.assertEqual(bool(tied_event_list), is_tied)
+
     def test_convert_rest(self):
         simple_event = core_events.SimpleEvent(3)
         self.converter.convert(simple_event, self.score_path)
@@ -136,6 +230,19 @@ class EventToIsisScoreTest(unittest.TestCase):
         self.assertEqual(result_score_section["loud_accents"], "0")
         self.assertEqual(result_score_section["tempo"], str(self.converter._tempo))
 
+    def test_convert_rest_with_empty_pitch_list(self):
+        simple_event = NoteLikeWithText([], 3, 1, ("t",), "a")
+        self.converter.convert(simple_event, self.score_path)
+        (
+            result_lyric_section,
+            result_score_section,
+        ) = self.fetch_result_score_section_tuple()
+
+        self.assertEqual(result_lyric_section["xsampa"], "_")
+        self.assertEqual(result_score_section["midiNotes"], "0.0")
+        self.assertEqual(result_score_section["rhythm"], "3.0")
+        self.assertEqual(result_score_section["loud_accents"], "0")
+
 
 class SimultaneousEventToIsisScoreTest(unittest.TestCase):
     def setUp(self):
@@ -151,5 +258,55 @@ class SimultaneousEventToIsisScoreTest(unittest.TestCase):
         )
 
 
+class EventToSingingSynthesisTest(unittest.TestCase):
+    path = "tests/converters/isis output.wav"
+    score_path = "tests/converters/isis score.cfg"
+
+    def setUp(self):
+        self.simple_event = NoteLikeWithText(
+            [music_parameters.WesternPitch()], 2.0, 0.5, ("t",), "a"
+        )
+
+    def test_convert_command(self):
+        converter = isis_converters.EventToSingingSynthesis(
+            isis_converters.EventToIsisScore(),
+            isis_converters.constants.SILENT_FLAG,
+            "-v 1",
+            remove_score_file=True,
+            isis_executable_path="my isis.sh",
+        )
+        with mock.patch("subprocess.run") as run:
+            converter.convert(self.simple_event, self.path, self.score_path)
+        run.assert_called_once_with(
+            [
+                "my isis.sh",
+                "-m",
+                self.score_path,
+                "-o",
+                self.path,
+                "--quiet",
+                "-v",
+                "1",
+            ],
+            check=False,
+        )
+        self.assertFalse(os.path.exists(self.score_path))
+
+    def test_convert_remove_score_file_if_isis_fails(self):
+        converter = isis_converters.EventToSingingSynthesis(
+            isis_converters.EventToIsisScore(),
+            remove_score_file=True,
+            isis_executable_path="nonexistent_isis.sh",
+        )
+        self.assertRaises(
+            FileNotFoundError,
+            converter.convert,
+            self.simple_event,
+            self.path,
+            self.score_path,
+        )
+        self.assertFalse(os.path.exists(self.score_path))
+
+
 if __name__ == "__main__":
     unittest.main()